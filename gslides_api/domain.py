@@ -1,7 +1,6 @@
 from typing import List, Dict, Optional, Any, Union
 from enum import Enum
-from pydantic import BaseModel, Field, model_validator
-from pydantic.json import pydantic_encoder
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # from gslides_api.notes import NotesPage
 
@@ -11,12 +10,38 @@ class GSlidesBaseModel(BaseModel):
 
     def to_api_format(self) -> Dict[str, Any]:
         """Convert to the format expected by the Google Slides API."""
-        return super().model_dump(exclude_none=True, mode="json")
+        # Call the compiled pydantic-core serializer directly rather than going through
+        # BaseModel.model_dump, which adds a Python-level wrapper on every call
+        return type(self).__pydantic_serializer__.to_python(self, exclude_none=True, mode="json")
+
+    def to_api_json(self) -> bytes:
+        """Convert to JSON bytes in the format expected by the Google Slides API."""
+        # Encoded by pydantic-core straight from the model, without building a dict first
+        return type(self).__pydantic_serializer__.to_json(self, exclude_none=True)
+
+
+class CachedEnum(Enum):
+    """Enum that can be looked up from an API value without raising on unknown values."""
+
+    @classmethod
+    def parse(cls, value: Any, default: Any = None) -> Any:
+        """Return the member for an API value, or default if there is none.
+
+        This is a single dict lookup, avoiding the EnumMeta.__call__ machinery and the
+        exception raised for unknown values. Unhashable values also give default.
+        """
+        try:
+            return cls._value2member_map_.get(value, default)
+        except TypeError:
+            # Unhashable values, such as dicts, cannot be members
+            return default
 
 
 class Dimension(GSlidesBaseModel):
     """Represents a size dimension with magnitude and unit."""
 
+    model_config = ConfigDict(frozen=True)
+
     magnitude: float
     unit: Optional[str] = None
 
@@ -31,6 +56,8 @@ class Size(GSlidesBaseModel):
 class Transform(GSlidesBaseModel):
     """Represents a transformation applied to an element."""
 
+    model_config = ConfigDict(frozen=True)
+
     translateX: float
     translateY: float
     scaleX: float
@@ -38,7 +65,7 @@ class Transform(GSlidesBaseModel):
     unit: Optional[str] = None  # Make optional to preserve original JSON exactly
 
 
-class ShapeType(Enum):
+class ShapeType(str, CachedEnum):
     """Enumeration of possible shape types."""
 
     TEXT_BOX = "TEXT_BOX"
@@ -50,7 +77,7 @@ class ShapeType(Enum):
     UNKNOWN = "UNKNOWN"
 
 
-class PlaceholderType(Enum):
+class PlaceholderType(str, CachedEnum):
     """Enumeration of possible placeholder types."""
 
     TITLE = "TITLE"
@@ -65,6 +92,9 @@ class PlaceholderType(Enum):
 class TextStyle(GSlidesBaseModel):
     """Represents styling for text."""
 
+    # Frozen so that a single empty instance can be shared as the default style
+    model_config = ConfigDict(frozen=True)
+
     # We'll use Optional for all fields and only include them in the output if they're present in the original
     bold: Optional[bool] = None
     italic: Optional[bool] = None
@@ -83,6 +113,8 @@ class TextStyle(GSlidesBaseModel):
 class ParagraphStyle(GSlidesBaseModel):
     """Represents styling for paragraphs."""
 
+    model_config = ConfigDict(frozen=True)
+
     direction: str = "LEFT_TO_RIGHT"
     indentStart: Optional[Dict[str, Any]] = None
     indentFirstLine: Optional[Dict[str, Any]] = None
@@ -94,9 +126,16 @@ class ParagraphStyle(GSlidesBaseModel):
     alignment: Optional[str] = None
 
 
+# Shared defaults, so that runs and markers without explicit styling don't each allocate one
+_EMPTY_TEXT_STYLE = TextStyle()
+_DEFAULT_PARAGRAPH_STYLE = ParagraphStyle()
+
+
 class BulletStyle(GSlidesBaseModel):
     """Represents styling for bullets in lists."""
 
+    model_config = ConfigDict(frozen=True)
+
     glyph: Optional[str] = None
     bold: bool = False
     italic: bool = False
@@ -108,7 +147,7 @@ class BulletStyle(GSlidesBaseModel):
 class ParagraphMarker(GSlidesBaseModel):
     """Represents a paragraph marker with styling."""
 
-    style: ParagraphStyle = Field(default_factory=ParagraphStyle)
+    style: ParagraphStyle = Field(default_factory=lambda: _DEFAULT_PARAGRAPH_STYLE)
     bullet: Optional[Dict[str, Any]] = None
 
 
@@ -116,7 +155,7 @@ class TextRun(GSlidesBaseModel):
     """Represents a run of text with consistent styling."""
 
     content: str
-    style: TextStyle = Field(default_factory=TextStyle)
+    style: TextStyle = Field(default_factory=lambda: _EMPTY_TEXT_STYLE)
 
 
 class AutoTextType(Enum):
@@ -132,7 +171,7 @@ class AutoText(GSlidesBaseModel):
     """Represents auto text content that is generated automatically."""
 
     type: AutoTextType
-    style: Optional[TextStyle] = Field(default_factory=TextStyle)
+    style: Optional[TextStyle] = Field(default_factory=lambda: _EMPTY_TEXT_STYLE)
     content: Optional[str] = None
 
 
@@ -156,12 +195,14 @@ class Text(GSlidesBaseModel):
 class RgbColor(GSlidesBaseModel):
     """Represents an RGB color."""
 
+    model_config = ConfigDict(frozen=True)
+
     red: Optional[float] = None
     green: Optional[float] = None
     blue: Optional[float] = None
 
 
-class ThemeColorType(Enum):
+class ThemeColorType(str, CachedEnum):
     """Enumeration of possible theme color types."""
 
     THEME_COLOR_TYPE_UNSPECIFIED = "THEME_COLOR_TYPE_UNSPECIFIED"
@@ -204,29 +245,23 @@ class Color(GSlidesBaseModel):
 
     @classmethod
     def from_api_format(cls, data: Dict[str, Any]) -> "Color":
-        """Create a Color from API format."""
-        if "rgbColor" in data:
-            rgb_color = (
-                RgbColor(**data["rgbColor"])
-                if isinstance(data["rgbColor"], dict)
-                else data["rgbColor"]
-            )
-            theme_color = None
-            if "themeColor" in data:
-                try:
-                    theme_color = ThemeColorType(data["themeColor"])
-                except (ValueError, TypeError):
-                    # Keep as is if conversion fails
-                    theme_color = data["themeColor"]
-            return cls(rgbColor=rgb_color, themeColor=theme_color)
-        elif "themeColor" in data:
-            try:
-                theme_color = ThemeColorType(data["themeColor"])
-            except (ValueError, TypeError):
-                # Keep as is if conversion fails
-                theme_color = data["themeColor"]
-            return cls(themeColor=theme_color)
-        return cls()
+        """Create a Color from API format.
+
+        Known values are built with model_construct and skip validation; anything else,
+        such as an unknown theme color, is validated as usual.
+        """
+        rgb_color = data.get("rgbColor")
+        if isinstance(rgb_color, dict):
+            rgb_color = RgbColor(**rgb_color)
+        theme_color = data.get("themeColor")
+        if theme_color is not None:
+            theme_color = ThemeColorType.parse(theme_color, theme_color)
+
+        if (rgb_color is None or isinstance(rgb_color, RgbColor)) and (
+            theme_color is None or isinstance(theme_color, ThemeColorType)
+        ):
+            return cls.model_construct(rgbColor=rgb_color, themeColor=theme_color)
+        return cls(rgbColor=rgb_color, themeColor=theme_color)
 
 
 class SolidFill(GSlidesBaseModel):
@@ -238,14 +273,16 @@ class SolidFill(GSlidesBaseModel):
     @classmethod
     def from_api_format(cls, data: Dict[str, Any]) -> "SolidFill":
         """Create a SolidFill from API format."""
-        color = None
-        if "color" in data and isinstance(data["color"], dict):
-            if "rgbColor" in data["color"] or "themeColor" in data["color"]:
-                color = Color.from_api_format(data["color"])
-            else:
-                color = Color(**data["color"])
+        color = data.get("color")
+        if isinstance(color, dict):
+            color = Color.from_api_format(color)
+        else:
+            color = None
 
-        return cls(color=color, alpha=data.get("alpha"))
+        alpha = data.get("alpha")
+        if alpha is None or isinstance(alpha, float):
+            return cls.model_construct(color=color, alpha=alpha)
+        return cls(color=color, alpha=alpha)
 
 
 class ShapeBackgroundFill(GSlidesBaseModel):
@@ -264,19 +301,21 @@ class OutlineFill(GSlidesBaseModel):
     def from_api_format(cls, data: Dict[str, Any]) -> "OutlineFill":
         """Create an OutlineFill from API format."""
         if "solidFill" in data and isinstance(data["solidFill"], dict):
-            solid_fill = SolidFill(**data["solidFill"])
-            return cls(solidFill=solid_fill)
-        return cls()
+            solid_fill = SolidFill.from_api_format(data["solidFill"])
+            return cls.model_construct(solidFill=solid_fill)
+        return cls.model_construct()
 
 
 class Weight(GSlidesBaseModel):
     """Represents the weight of an outline."""
 
+    model_config = ConfigDict(frozen=True)
+
     magnitude: Optional[float] = None
     unit: Optional[str] = None
 
 
-class DashStyle(Enum):
+class DashStyle(str, CachedEnum):
     """Enumeration of possible dash styles for outlines."""
 
     DASH_STYLE_UNSPECIFIED = "DASH_STYLE_UNSPECIFIED"
@@ -300,6 +339,8 @@ class Outline(GSlidesBaseModel):
 class ShadowTransform(GSlidesBaseModel):
     """Represents a shadow transform."""
 
+    model_config = ConfigDict(frozen=True)
+
     scaleX: Optional[float] = None
     scaleY: Optional[float] = None
     unit: Optional[str] = None
@@ -308,18 +349,20 @@ class ShadowTransform(GSlidesBaseModel):
 class BlurRadius(GSlidesBaseModel):
     """Represents a blur radius."""
 
+    model_config = ConfigDict(frozen=True)
+
     magnitude: Optional[float] = None
     unit: Optional[str] = None
 
 
-class ShadowType(Enum):
+class ShadowType(str, CachedEnum):
     """Enumeration of possible shadow types."""
 
     SHADOW_TYPE_UNSPECIFIED = "SHADOW_TYPE_UNSPECIFIED"
     OUTER = "OUTER"
 
 
-class RectanglePosition(Enum):
+class RectanglePosition(str, CachedEnum):
     """Enumeration of possible rectangle positions."""
 
     RECTANGLE_POSITION_UNSPECIFIED = "RECTANGLE_POSITION_UNSPECIFIED"
@@ -360,6 +403,8 @@ class ShapeProperties(GSlidesBaseModel):
 class Placeholder(GSlidesBaseModel):
     """Represents a placeholder in a slide."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: PlaceholderType
     parentObjectId: Optional[str] = None
     index: Optional[int] = None
@@ -388,6 +433,8 @@ class Table(GSlidesBaseModel):
 class CropProperties(GSlidesBaseModel):
     """Represents crop properties of an image."""
 
+    model_config = ConfigDict(frozen=True)
+
     leftOffset: Optional[float] = None
     rightOffset: Optional[float] = None
     topOffset: Optional[float] = None
@@ -398,12 +445,14 @@ class CropProperties(GSlidesBaseModel):
 class ColorStop(GSlidesBaseModel):
     """Represents a color and position in a gradient."""
 
+    model_config = ConfigDict(frozen=True)
+
     color: Optional[Color] = None
     alpha: Optional[float] = 1.0
     position: Optional[float] = None
 
 
-class RecolorName(Enum):
+class RecolorName(str, CachedEnum):
     """Enumeration of possible recolor effect names."""
 
     NONE = "NONE"
@@ -457,30 +506,11 @@ class Image(GSlidesBaseModel):
     """Represents an image in a slide."""
 
     contentUrl: Optional[str] = None
-    imageProperties: Optional[Union[Dict[str, Any], ImageProperties]] = None
+    imageProperties: Optional[ImageProperties] = None
     sourceUrl: Optional[str] = None
 
-    @model_validator(mode="after")
-    def convert_image_properties(self) -> "Image":
-        """Convert imageProperties to ImageProperties if it's a dict."""
-        if self.imageProperties is not None and not isinstance(
-            self.imageProperties, ImageProperties
-        ):
-            # Track the original type
-            if isinstance(self.imageProperties, dict):
-                self._original_properties_type = "dict"
-            else:
-                self._original_properties_type = type(self.imageProperties).__name__
-
-            try:
-                self.imageProperties = ImageProperties.model_validate(self.imageProperties)
-            except (ValueError, TypeError):
-                # Keep as is if conversion fails
-                pass
-        return self
-
 
-class VideoSourceType(Enum):
+class VideoSourceType(str, CachedEnum):
     """Enumeration of possible video source types."""
 
     YOUTUBE = "YOUTUBE"
@@ -567,7 +597,7 @@ class Group(GSlidesBaseModel):
     children: Optional[List[Any]] = None  # This will be a list of PageElement objects
 
 
-class PropertyState(Enum):
+class PropertyState(str, CachedEnum):
     """The possible states of a property."""
 
     RENDERED = "RENDERED"
@@ -16,10 +16,10 @@ from gslides_api.domain import (
     Group,
 )
 from gslides_api.execute import slides_batch_update
-from gslides_api.utils import dict_to_dot_separated_field_list
+from gslides_api.utils import dict_to_dot_separated_field_list, new_object_id
 
 
-class ElementKind(Enum):
+class ElementKind(str, Enum):
     """Enumeration of possible page element kinds based on the Google Slides API.
 
     Reference: https://developers.google.com/workspace/slides/api/reference/rest/v1/presentations.pages#pageelement
@@ -54,18 +54,23 @@ class PageElement(GSlidesBaseModel):
     speakerSpotlight: Optional[SpeakerSpotlight] = None
     elementGroup: Optional[Group] = None
 
-    def create_copy(self, parent_id: str, presentation_id: str):
-        request = self.create_request(parent_id)
-        out = slides_batch_update(request, presentation_id)
-        try:
-            request_type = list(out["replies"][0].keys())[0]
-            new_element_id = out["replies"][0][request_type]["objectId"]
-            return new_element_id
-        except:
-            return None
+    def create_copy(self, parent_id: str, presentation_id: str) -> str:
+        return create_many([self], parent_id, presentation_id)[0]
 
-    def create_request(self, parent_id: str) -> List[Dict[str, Any]]:
-        """Convert a PageElement to a create request for the Google Slides API."""
+    def create_request(
+        self, parent_id: str, object_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Convert a PageElement to a create request for the Google Slides API.
+        :param parent_id: The id of the page to create the element on
+        :type parent_id: str
+        :param object_id: The id to give the new element, a fresh one is generated if omitted
+        :type object_id: str, optional
+        :return: The create request
+        :rtype: list
+
+        """
+        if object_id is None:
+            object_id = new_object_id()
 
         # Common element properties
         element_properties = {
@@ -80,83 +85,12 @@ class PageElement(GSlidesBaseModel):
         if self.description is not None:
             element_properties["description"] = self.description
 
-        if self.shape is not None:
-            return [
-                {
-                    "createShape": {
-                        "elementProperties": element_properties,
-                        "shapeType": self.shape.shapeType.value,
-                    }
-                }
-            ]
-        elif self.image is not None:
-            return [
-                {
-                    "createImage": {
-                        "elementProperties": element_properties,
-                        "url": self.image.contentUrl,
-                    }
-                }
-            ]
-        elif self.table is not None:
-            return [
-                {
-                    "createTable": {
-                        "elementProperties": element_properties,
-                        "rows": self.table.rows,
-                        "columns": self.table.columns,
-                    }
-                }
-            ]
-        elif self.video is not None:
-            if self.video.source is None:
-                raise ValueError("Video source type is required")
-
-            return [
-                {
-                    "createVideo": {
-                        "elementProperties": element_properties,
-                        "source": self.video.source.value,
-                        "id": self.video.id,
-                    }
-                }
-            ]
-        elif self.line is not None:
-            return [
-                {
-                    "createLine": {
-                        "elementProperties": element_properties,
-                        "lineCategory": self.line.lineType if self.line.lineType else "STRAIGHT",
-                    }
-                }
-            ]
-        elif self.sheetsChart is not None:
-            if not self.sheetsChart.spreadsheetId or not self.sheetsChart.chartId:
-                raise ValueError("Spreadsheet ID and Chart ID are required for Sheets Chart")
-
-            return [
-                {
-                    "createSheetsChart": {
-                        "elementProperties": element_properties,
-                        "spreadsheetId": self.sheetsChart.spreadsheetId,
-                        "chartId": self.sheetsChart.chartId,
-                    }
-                }
-            ]
-        elif self.wordArt is not None:
-            if not self.wordArt.renderedText:
-                raise ValueError("Rendered text is required for Word Art")
-
-            return [
-                {
-                    "createWordArt": {
-                        "elementProperties": element_properties,
-                        "renderedText": self.wordArt.renderedText,
-                    }
-                }
-            ]
-        else:
-            raise ValueError(f"Unsupported element type {self}, {self.__dict__}")
+        for attr, build in _CREATE_BUILDERS:
+            value = getattr(self, attr)
+            if value is not None:
+                return [build(value, object_id, element_properties)]
+
+        raise ValueError(f"Unsupported element type {self}, {self.__dict__}")
 
     def update(self, presentation_id: str, element_id: Optional[str] = None) -> Dict[str, Any]:
         if element_id is None:
@@ -218,90 +152,274 @@ class PageElement(GSlidesBaseModel):
             shape_requests = []
             if self.shape.text is None:
                 return requests
+            # Consecutive runs with identical styling are merged into one updateTextStyle,
+            # and contiguous text is inserted in one go, so a shape costs 1 + K requests
+            # (K distinct style groups) instead of two requests per run
+            runs = []
             for te in self.shape.text.textElements:
                 if te.textRun is None:
                     # TODO: What is the role of empty ParagraphMarkers?
                     continue
 
                 style = te.textRun.style.to_api_format()
-                shape_requests += [
+                if runs:
+                    prev = runs[-1]
+                    if prev["style"] == style and prev["endIndex"] == (te.startIndex or 0):
+                        prev["text"] += te.textRun.content
+                        prev["endIndex"] = te.endIndex
+                        continue
+                runs.append(
+                    {
+                        "text": te.textRun.content,
+                        "insertionIndex": te.startIndex,
+                        "startIndex": te.startIndex or 0,
+                        "endIndex": te.endIndex,
+                        "style": style,
+                    }
+                )
+
+            inserts = []
+            for run in runs:
+                if inserts and inserts[-1]["endIndex"] == run["startIndex"]:
+                    inserts[-1]["text"] += run["text"]
+                    inserts[-1]["endIndex"] = run["endIndex"]
+                else:
+                    inserts.append(
+                        {
+                            "text": run["text"],
+                            "insertionIndex": run["insertionIndex"],
+                            "endIndex": run["endIndex"],
+                        }
+                    )
+
+            for insert in inserts:
+                shape_requests.append(
                     {
                         "insertText": {
                             "objectId": element_id,
-                            "text": te.textRun.content,
-                            "insertionIndex": te.startIndex,
+                            "text": insert["text"],
+                            "insertionIndex": insert["insertionIndex"],
                         }
-                    },
+                    }
+                )
+            # Styles go after all the inserts, so their ranges refer to the final text
+            for run in runs:
+                shape_requests.append(
                     {
                         "updateTextStyle": {
                             "objectId": element_id,
                             "textRange": {
-                                "startIndex": te.startIndex or 0,
-                                "endIndex": te.endIndex,
+                                "startIndex": run["startIndex"],
+                                "endIndex": run["endIndex"],
                                 "type": "FIXED_RANGE",
                             },
-                            "style": style,
+                            "style": run["style"],
                             "fields": "*",
                         }
-                    },
-                ]
+                    }
+                )
 
             return requests + shape_requests
-        elif self.image is not None:
-            if hasattr(self.image, "imageProperties") and self.image.imageProperties is not None:
-                image_properties = self.image.imageProperties.to_api_format()
-                # "fields": "*" causes an error
-                image_requests = [
-                    {
-                        "updateImageProperties": {
-                            "objectId": element_id,
-                            "imageProperties": image_properties,
-                            "fields": ",".join(dict_to_dot_separated_field_list(image_properties)),
-                        }
-                    }
-                ]
-                return requests + image_requests
-        elif self.video is not None:
-            if hasattr(self.video, "videoProperties") and self.video.videoProperties is not None:
-                video_properties = self.video.videoProperties.to_api_format()
-                video_requests = [
-                    {
-                        "updateVideoProperties": {
-                            "objectId": element_id,
-                            "videoProperties": video_properties,
-                            "fields": ",".join(dict_to_dot_separated_field_list(video_properties)),
-                        }
-                    }
-                ]
-                return requests + video_requests
-        elif self.line is not None:
-            if hasattr(self.line, "lineProperties") and self.line.lineProperties is not None:
-                line_properties = self.line.lineProperties.to_api_format()
-                line_requests = [
-                    {
-                        "updateLineProperties": {
-                            "objectId": element_id,
-                            "lineProperties": line_properties,
-                            "fields": ",".join(dict_to_dot_separated_field_list(line_properties)),
-                        }
-                    }
-                ]
-                return requests + line_requests
-        elif self.sheetsChart is not None:
-            if (
-                hasattr(self.sheetsChart, "sheetsChartProperties")
-                and self.sheetsChart.sheetsChartProperties is not None
-            ):
-                chart_properties = self.sheetsChart.sheetsChartProperties.to_api_format()
-                chart_requests = [
+
+        for attr, properties_attr, request_type in _UPDATE_PROPERTIES_REQUESTS:
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            properties = getattr(value, properties_attr)
+            if properties is not None:
+                api_properties = properties.to_api_format()
+                # "fields": "*" causes an error, so the set fields are listed explicitly
+                requests.append(
                     {
-                        "updateSheetsChartProperties": {
+                        request_type: {
                             "objectId": element_id,
-                            "sheetsChartProperties": chart_properties,
-                            "fields": ",".join(dict_to_dot_separated_field_list(chart_properties)),
+                            properties_attr: api_properties,
+                            "fields": ",".join(dict_to_dot_separated_field_list(api_properties)),
                         }
                     }
-                ]
-                return requests + chart_requests
+                )
+            break
 
         return requests
+
+
+def create_many(elements: List[PageElement], parent_id: str, presentation_id: str) -> List[str]:
+    """Create copies of several page elements on a page with a single batch update.
+
+    Args:
+        elements: The elements to copy.
+        parent_id: The ID of the page to create the elements on.
+        presentation_id: The ID of the presentation containing the page.
+
+    Returns:
+        The IDs of the new elements, in the same order as ``elements``.
+
+    Raises:
+        ValueError: If a reply does not confirm the ID of the element it created.
+    """
+    if not elements:
+        return []
+
+    # IDs are assigned client-side; the replies are only checked to confirm them
+    new_ids = [new_object_id() for _ in elements]
+    requests = []
+    for element, object_id in zip(elements, new_ids, strict=True):
+        requests += element.create_request(parent_id, object_id)
+    # Every request is a create under a client-assigned ID, so a replay cannot duplicate it
+    out = slides_batch_update(requests, presentation_id, replay_safe=True)
+
+    replies = out.get("replies", [])
+    for i, object_id in enumerate(new_ids):
+        created = next(iter(replies[i].values()), {}) if i < len(replies) else {}
+        if created.get("objectId") != object_id:
+            raise ValueError(f"Element {elements[i].objectId} was not created as {object_id}")
+    return new_ids
+
+
+def update_many(
+    elements: List[PageElement], element_ids: List[str], presentation_id: str
+) -> Dict[str, Any]:
+    """Apply the update requests of several page elements with a single batch update.
+
+    Args:
+        elements: The elements whose properties and text should be written.
+        element_ids: The IDs of the elements to update, one per element.
+        presentation_id: The ID of the presentation containing the elements.
+
+    Returns:
+        The batch update response, or an empty dict if there was nothing to update.
+
+    Raises:
+        ValueError: If elements and element_ids differ in length.
+    """
+    if len(elements) != len(element_ids):
+        raise ValueError(
+            f"Got {len(elements)} elements but {len(element_ids)} element ids to update"
+        )
+
+    requests = []
+    for element, element_id in zip(elements, element_ids):
+        requests += element.element_to_update_request(element_id)
+    if len(requests):
+        return slides_batch_update(requests, presentation_id)
+    else:
+        return {}
+
+
+def _create_shape_request(
+    shape: Shape, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "createShape": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            # ShapeType is a str enum, so the member is already its API string
+            "shapeType": shape.shapeType,
+        }
+    }
+
+
+def _create_image_request(
+    image: Image, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "createImage": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "url": image.contentUrl,
+        }
+    }
+
+
+def _create_table_request(
+    table: Table, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "createTable": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "rows": table.rows,
+            "columns": table.columns,
+        }
+    }
+
+
+def _create_video_request(
+    video: Video, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    if video.source is None:
+        raise ValueError("Video source type is required")
+
+    return {
+        "createVideo": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "source": video.source,
+            "id": video.id,
+        }
+    }
+
+
+def _create_line_request(
+    line: Line, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        "createLine": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "lineCategory": line.lineType if line.lineType else "STRAIGHT",
+        }
+    }
+
+
+def _create_sheets_chart_request(
+    sheets_chart: SheetsChart, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    if not sheets_chart.spreadsheetId or not sheets_chart.chartId:
+        raise ValueError("Spreadsheet ID and Chart ID are required for Sheets Chart")
+
+    return {
+        "createSheetsChart": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "spreadsheetId": sheets_chart.spreadsheetId,
+            "chartId": sheets_chart.chartId,
+        }
+    }
+
+
+def _create_word_art_request(
+    word_art: WordArt, object_id: str, element_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    if not word_art.renderedText:
+        raise ValueError("Rendered text is required for Word Art")
+
+    return {
+        "createWordArt": {
+            "objectId": object_id,
+            "elementProperties": element_properties,
+            "renderedText": word_art.renderedText,
+        }
+    }
+
+
+# Element kinds that can be created, checked in this order; the first set one wins
+_CREATE_BUILDERS = (
+    ("shape", _create_shape_request),
+    ("image", _create_image_request),
+    ("table", _create_table_request),
+    ("video", _create_video_request),
+    ("line", _create_line_request),
+    ("sheetsChart", _create_sheets_chart_request),
+    ("wordArt", _create_word_art_request),
+)
+
+
+# Element kinds whose properties are written with an update*Properties request, as
+# (PageElement field, properties field, request type); the first set kind wins
+_UPDATE_PROPERTIES_REQUESTS = (
+    ("image", "imageProperties", "updateImageProperties"),
+    ("video", "videoProperties", "updateVideoProperties"),
+    ("line", "lineProperties", "updateLineProperties"),
+    ("sheetsChart", "sheetsChartProperties", "updateSheetsChartProperties"),
+)
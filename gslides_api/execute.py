@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 
 import google.auth
@@ -8,12 +8,24 @@ from gslides import creds
 
 # The functions in this file are the only interaction with the raw gslides API in this library
 
+# Retries for 429 and 5xx responses, socket timeouts and connection errors; googleapiclient
+# backs off exponentially with jitter. A timed-out call may already have been applied, so
+# only calls that are safe to replay are retried.
+_NUM_RETRIES = 5
 
-def slides_batch_update(requests: list, presentation_id: str) -> Dict[str, Any]:
+
+def slides_batch_update(
+    requests: list, presentation_id: str, replay_safe: bool = False
+) -> Dict[str, Any]:
+    """Send a batchUpdate to the Slides API.
+
+    Only pass replay_safe=True if every request is idempotent or creates an object under a
+    client-assigned ID; the call is then retried on transient failures.
+    """
     return (
         creds.slide_service.presentations()
         .batchUpdate(presentationId=presentation_id, body={"requests": requests})
-        .execute()
+        .execute(num_retries=_NUM_RETRIES if replay_safe else 0)
     )
 
 
@@ -28,12 +40,76 @@ def get_slide_json(presentation_id: str, slide_id: str) -> Dict[str, Any]:
         creds.slide_service.presentations()
         .pages()
         .get(presentationId=presentation_id, pageObjectId=slide_id)
-        .execute()
+        .execute(num_retries=_NUM_RETRIES)
     )
 
 
 def get_presentation_json(presentation_id: str) -> Dict[str, Any]:
-    return creds.slide_service.presentations().get(presentationId=presentation_id).execute()
+    return (
+        creds.slide_service.presentations()
+        .get(presentationId=presentation_id)
+        .execute(num_retries=_NUM_RETRIES)
+    )
+
+
+# Google caps a single HTTP batch request at 100 calls
+_MAX_BATCH_SIZE = 100
+
+
+def _execute_batched(http_requests: list) -> List[Dict[str, Any]]:
+    """Execute independent API calls through HTTP batch requests.
+
+    Up to 100 calls share each HTTP round trip; the responses are returned in the order
+    of the requests. If any call in a batch fails, the error of the earliest failed call
+    in request order is raised, and later batches are not sent. Unlike the single-call
+    helpers above, batched calls are not retried.
+    """
+    responses = [None] * len(http_requests)
+    errors = []
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            # Callbacks may arrive in any order, so keep the index to find the earliest failure
+            errors.append((int(request_id), exception))
+        else:
+            responses[int(request_id)] = response
+
+    for start in range(0, len(http_requests), _MAX_BATCH_SIZE):
+        batch = creds.slide_service.new_batch_http_request(callback=callback)
+        for i, http_request in enumerate(http_requests[start : start + _MAX_BATCH_SIZE], start):
+            batch.add(http_request, request_id=str(i))
+        batch.execute()
+        if errors:
+            raise min(errors, key=lambda e: e[0])[1]
+
+    return responses
+
+
+def slides_batch_update_many(updates: List[Tuple[list, str]]) -> List[Dict[str, Any]]:
+    """Run several batchUpdate calls, given as (requests, presentation_id) pairs, together."""
+    presentations = creds.slide_service.presentations()
+    return _execute_batched(
+        [
+            presentations.batchUpdate(presentationId=presentation_id, body={"requests": requests})
+            for requests, presentation_id in updates
+        ]
+    )
+
+
+def get_slides_json_many(presentation_id: str, slide_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch the JSON of several slides of one presentation together, in slide_ids order."""
+    pages = creds.slide_service.presentations().pages()
+    return _execute_batched(
+        [pages.get(presentationId=presentation_id, pageObjectId=slide_id) for slide_id in slide_ids]
+    )
+
+
+def get_presentations_json_many(presentation_ids: List[str]) -> List[Dict[str, Any]]:
+    """Fetch the JSON of several presentations together, in presentation_ids order."""
+    presentations = creds.slide_service.presentations()
+    return _execute_batched(
+        [presentations.get(presentationId=presentation_id) for presentation_id in presentation_ids]
+    )
 
 
 # TODO: test this out and adjust the credentials readme (Drive API scope, anything else?)
@@ -16,7 +16,12 @@ from gslides_api.domain import (
 # Import PageElement and ElementKind directly to avoid circular imports
 from gslides_api.element import PageElement, ElementKind
 from gslides_api.execute import slides_batch_update, get_slide_json
-from gslides_api.utils import duplicate_object, delete_object, dict_to_dot_separated_field_list
+from gslides_api.utils import (
+    duplicate_object,
+    delete_object,
+    dict_to_dot_separated_field_list,
+    new_object_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -154,7 +159,7 @@ class Page(GSlidesBaseModel):
         slide_properties.pop("masterObjectId", None)
         # This has already been set when creating the slide
         slide_properties.pop("layoutObjectId", None)
-        request = [
+        requests = [
             {
                 "updateSlideProperties": {
                     "objectId": slide_id,
@@ -163,11 +168,13 @@ class Page(GSlidesBaseModel):
                 }
             }
         ]
-        slides_batch_update(request, presentation_id)
 
         if self.pageElements is not None:
             # Some elements came from layout, some were created manually
             # Let's first match those that came from layout, before creating new ones
+            # New elements get client-side ids, so they can be created and updated in one batch
+            create_requests = []
+            update_requests = []
             for kind in ElementKind:
                 my_elements = self.select_elements(kind)
                 layout_elements = new_slide.select_elements(kind)
@@ -175,15 +182,23 @@ class Page(GSlidesBaseModel):
                     if i < len(layout_elements):
                         element_id = layout_elements[i].objectId
                     else:
-                        element_id = element.create_copy(slide_id, presentation_id)
-                    element.update(presentation_id, element_id)
+                        element_id = new_object_id()
+                        create_requests += element.create_request(slide_id, element_id)
+                    update_requests += element.element_to_update_request(element_id)
+
+            # Creates go first so that the updates can refer to the new elements
+            requests += create_requests + update_requests
+
+        # The slide properties and all element creates and updates go out in a single batch update
+        slides_batch_update(requests, presentation_id)
 
         return self.from_ids(presentation_id, slide_id)
 
     def select_elements(self, kind: ElementKind) -> List[PageElement]:
         if self.pageElements is None:
             return []
-        return [e for e in self.pageElements if getattr(e, kind.value) is not None]
+        # ElementKind is a str enum whose members are the PageElement field names
+        return [e for e in self.pageElements if getattr(e, kind) is not None]
 
     @property
     def image_elements(self):
@@ -1,4 +1,3 @@
-import copy
 import logging
 from typing import List, Optional, Dict, Any
 
@@ -68,13 +67,13 @@ class Presentation(GSlidesBaseModel):
         self.__dict__ = re_p.__dict__
 
     def slide_from_id(self, slide_id: str) -> Optional[Page]:
-        match = [s for s in self.slides if s.objectId == slide_id]
-        if len(match) == 0:
+        # Stops at the first match, without building the list of all matches
+        slide = next((s for s in self.slides or [] if s.objectId == slide_id), None)
+        if slide is None:
             logger.error(
                 f"Slide with id {slide_id} not found in presentation {self.presentationId}"
             )
-            return None
-        return match[0]
+        return slide
 
     @property
     def url(self):
@@ -1,3 +1,4 @@
+import uuid
 from typing import Dict, Any, List
 
 from gslides_api.execute import slides_batch_update
@@ -20,8 +21,8 @@ def duplicate_object(object_id: str, presentation_id: str) -> str:
 
     request = {"duplicateObject": {"objectId": object_id}}
     out = slides_batch_update([request], presentation_id)
-    new_object_id = out["replies"][0]["duplicateObject"]["objectId"]
-    return new_object_id
+    duplicate_id = out["replies"][0]["duplicateObject"]["objectId"]
+    return duplicate_id
 
 
 def delete_object(object_id: str, presentation_id: str) -> None:
@@ -35,12 +36,30 @@ def delete_object(object_id: str, presentation_id: str) -> None:
     slides_batch_update([request], presentation_id)
 
 
+def new_object_id() -> str:
+    """Generate a fresh object ID for a create request.
+
+    The Slides API accepts client-chosen IDs of 5 to 50 characters from [a-zA-Z0-9_-:],
+    so a new element's ID is known without waiting for the batch update reply.
+    """
+    return uuid.uuid4().hex
+
+
 def dict_to_dot_separated_field_list(x: Dict[str, Any]) -> List[str]:
     """Convert a dictionary to a list of dot-separated fields."""
     out = []
     for k, v in x.items():
-        if isinstance(v, dict):
-            out += [f"{k}.{i}" for i in dict_to_dot_separated_field_list(v)]
-        else:
+        if not isinstance(v, dict):
             out.append(k)
+            continue
+        # Nested dicts use an explicit stack instead of recursion; children are pushed
+        # in reverse so fields come out in key order
+        stack = [(k, v)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                prefix = path + "."
+                stack += [(prefix + ck, cv) for ck, cv in reversed(value.items())]
+            else:
+                out.append(path)
     return out
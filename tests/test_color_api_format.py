@@ -1,6 +1,8 @@
 import pytest
 import json
+import warnings
 from gslides_api.domain import Color, RgbColor, ThemeColorType
+from pydantic import ValidationError
 from gslides_api.json_diff import json_diff
 
 
@@ -83,3 +85,23 @@ def test_color_with_enum_handling():
         # Let's check if that's the case
         if api_format['themeColor'] == 'ACCENT1' and model_dump['themeColor'] != 'ACCENT1':
             print("to_api_format() uses enum.value while model_dump() uses a different representation")
+
+
+def test_color_from_api_format_theme_color_lookup():
+    """Test that from_api_format resolves known theme colors and validates unknown ones."""
+    color = Color.from_api_format({"rgbColor": {"red": 0.5}, "themeColor": "ACCENT2"})
+    assert color.themeColor is ThemeColorType.ACCENT2
+    assert color.rgbColor == RgbColor(red=0.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert color.to_api_format() == {"rgbColor": {"red": 0.5}, "themeColor": "ACCENT2"}
+
+    assert ThemeColorType.parse("ACCENT2") is ThemeColorType.ACCENT2
+    assert ThemeColorType.parse("NOT_A_THEME_COLOR") is None
+    assert ThemeColorType.parse({"not": "hashable"}) is None
+    with pytest.raises(ValidationError):
+        Color.from_api_format({"themeColor": "NOT_A_THEME_COLOR"})
+    with pytest.raises(ValidationError):
+        Color.from_api_format({"themeColor": {"not": "hashable"}})
+    with pytest.raises(ValidationError):
+        Color.from_api_format({"rgbColor": {"red": "abc"}})
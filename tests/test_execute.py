@@ -0,0 +1,135 @@
+from types import SimpleNamespace
+
+import pytest
+
+import gslides_api.execute
+from gslides_api.execute import (
+    get_presentation_json,
+    get_presentations_json_many,
+    get_slides_json_many,
+    slides_batch_update,
+    slides_batch_update_many,
+)
+
+
+class FakeBatch:
+    """Stands in for googleapiclient's BatchHttpRequest, answering each call in reverse order."""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.calls = []
+
+    def add(self, request, request_id):
+        self.calls.append((request, request_id))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.calls))
+        for request, request_id in reversed(self.calls):
+            if request in self.service.failing:
+                self.callback(request_id, None, RuntimeError(f"failed {request}"))
+            else:
+                self.callback(request_id, {"request": request}, None)
+
+
+class FakeSlideService:
+    """Builds plain tuples instead of HTTP requests, so the tests can check what was sent."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.batch_sizes = []
+
+    def new_batch_http_request(self, callback):
+        return FakeBatch(self, callback)
+
+    def presentations(self):
+        return self
+
+    def pages(self):
+        return self
+
+    def get(self, **kwargs):
+        return ("get",) + tuple(sorted(kwargs.items()))
+
+    def batchUpdate(self, presentationId, body):
+        return ("batchUpdate", presentationId, len(body["requests"]))
+
+
+@pytest.fixture
+def fake_service(monkeypatch):
+    service = FakeSlideService()
+    monkeypatch.setattr(gslides_api.execute, "creds", SimpleNamespace(slide_service=service))
+    return service
+
+
+def test_batched_responses_keep_request_order(fake_service):
+    """Test that responses come back in request order, split into batches of at most 100 calls."""
+    slide_ids = [f"slide_{i}" for i in range(250)]
+
+    out = get_slides_json_many("presentation_id", slide_ids)
+
+    assert fake_service.batch_sizes == [100, 100, 50]
+    assert [r["request"] for r in out] == [
+        ("get", ("pageObjectId", slide_id), ("presentationId", "presentation_id"))
+        for slide_id in slide_ids
+    ]
+
+
+def test_batched_helpers_build_one_call_per_item(fake_service):
+    """Test that the presentation and batchUpdate helpers send one call per item."""
+    presentations = get_presentations_json_many(["a", "b"])
+    updates = slides_batch_update_many([([{}], "a"), ([{}, {}], "b")])
+
+    assert [r["request"] for r in presentations] == [
+        ("get", ("presentationId", "a")),
+        ("get", ("presentationId", "b")),
+    ]
+    assert [r["request"] for r in updates] == [("batchUpdate", "a", 1), ("batchUpdate", "b", 2)]
+    assert get_presentations_json_many([]) == []
+
+
+def test_batched_raises_first_error(fake_service):
+    """Test that the earliest failed call in request order raises, and later batches are not sent."""
+    # The fake batch answers in reverse order, so p_50's error arrives first
+    fake_service.failing = {("get", ("presentationId", "p_5")), ("get", ("presentationId", "p_50"))}
+
+    with pytest.raises(RuntimeError, match="'p_5'"):
+        get_presentations_json_many([f"p_{i}" for i in range(150)])
+    assert fake_service.batch_sizes == [100]
+
+
+class RecordingCall:
+    def __init__(self, retries):
+        self.retries = retries
+
+    def execute(self, num_retries=0):
+        self.retries.append(num_retries)
+        return {}
+
+
+class RecordingSlideService:
+    """Records the num_retries each single call is executed with."""
+
+    def __init__(self):
+        self.retries = []
+
+    def presentations(self):
+        return self
+
+    def get(self, **kwargs):
+        return RecordingCall(self.retries)
+
+    def batchUpdate(self, presentationId, body):
+        return RecordingCall(self.retries)
+
+
+def test_only_replay_safe_calls_are_retried(monkeypatch):
+    """Test that reads are retried, but batch updates only when marked replay-safe."""
+    service = RecordingSlideService()
+    monkeypatch.setattr(gslides_api.execute, "creds", SimpleNamespace(slide_service=service))
+
+    slides_batch_update([{}], "presentation_id")
+    slides_batch_update([{}], "presentation_id", replay_safe=True)
+    get_presentation_json("presentation_id")
+
+    assert service.retries == [0, 5, 5]
@@ -4,7 +4,8 @@ from gslides_api.domain import (
     Size, Transform, Shape, ShapeProperties, ShapeType, 
     Line, LineProperties, WordArt, SheetsChart, SheetsChartProperties,
     SpeakerSpotlight, SpeakerSpotlightProperties, Group, Video, VideoProperties,
-    Image, ImageProperties, Table
+    Image, ImageProperties, Table, Text, TextElement, TextRun, TextStyle,
+    ParagraphMarker
 )
 
 def test_page_element_fields():
@@ -139,3 +140,153 @@ def test_update_request_with_title_description():
     assert "updatePageElementProperties" in request[0]
     assert request[0]["updatePageElementProperties"]["pageElementProperties"]["title"] == "Updated Title"
     assert request[0]["updatePageElementProperties"]["pageElementProperties"]["description"] == "Updated Description"
+
+
+def test_update_request_merges_runs_with_same_style():
+    """Test that contiguous text is inserted once and same-style runs share one style update."""
+    element = PageElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(
+            shapeType=ShapeType.TEXT_BOX,
+            shapeProperties=ShapeProperties(),
+            text=Text(
+                textElements=[
+                    TextElement(endIndex=12, paragraphMarker=ParagraphMarker()),
+                    TextElement(endIndex=6, textRun=TextRun(content="Hello ")),
+                    TextElement(startIndex=6, endIndex=12, textRun=TextRun(content="world\n")),
+                    TextElement(
+                        startIndex=12,
+                        endIndex=17,
+                        textRun=TextRun(content="bold\n", style=TextStyle(bold=True)),
+                    ),
+                ]
+            ),
+        ),
+    )
+
+    requests = element.element_to_update_request("shape_id")
+    inserts = [r["insertText"] for r in requests if "insertText" in r]
+    styles = [r["updateTextStyle"] for r in requests if "updateTextStyle" in r]
+
+    assert [i["text"] for i in inserts] == ["Hello world\nbold\n"]
+    assert inserts[0]["insertionIndex"] is None
+    # All inserts come before any style update
+    assert "insertText" in requests[0] and "updateTextStyle" in requests[-1]
+    assert len(styles) == 2
+    assert styles[0]["textRange"]["startIndex"] == 0
+    assert styles[0]["textRange"]["endIndex"] == 12
+    assert styles[1]["style"] == {"bold": True}
+
+
+def test_create_many_uses_one_batch_update(monkeypatch):
+    """Test that create_many sends all create requests at once with client-side ids."""
+    import gslides_api.element
+    from gslides_api.element import create_many
+
+    calls = []
+
+    def mock_slides_batch_update(requests, presentation_id, replay_safe=False):
+        # Only client-id creates are sent, so the call may be retried
+        assert replay_safe
+        calls.append(requests)
+        return {"replies": [{"createShape": r["createShape"]} for r in requests]}
+
+    monkeypatch.setattr(gslides_api.element, "slides_batch_update", mock_slides_batch_update)
+
+    elements = [
+        PageElement(
+            objectId=f"shape_{i}",
+            size=Size(width=100, height=100),
+            transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+            shape=Shape(shapeType=ShapeType.RECTANGLE, shapeProperties=ShapeProperties()),
+        )
+        for i in range(3)
+    ]
+
+    new_ids = create_many(elements, "slide_id", "presentation_id")
+    assert len(calls) == 1
+    assert [r["createShape"]["objectId"] for r in calls[0]] == new_ids
+    assert len(set(new_ids)) == 3
+    assert not set(new_ids) & {e.objectId for e in elements}
+
+
+def test_create_many_raises_on_missing_reply(monkeypatch):
+    """Test that create_many raises rather than returning an id the server did not confirm."""
+    import gslides_api.element
+    from gslides_api.element import create_many
+
+    monkeypatch.setattr(
+        gslides_api.element, "slides_batch_update", lambda requests, presentation_id, replay_safe=False: {}
+    )
+    element = PageElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(shapeType=ShapeType.RECTANGLE, shapeProperties=ShapeProperties()),
+    )
+
+    with pytest.raises(ValueError):
+        create_many([element], "slide_id", "presentation_id")
+
+
+def test_update_many_uses_one_batch_update(monkeypatch):
+    """Test that update_many sends all update requests at once, in element order."""
+    import gslides_api.element
+    from gslides_api.element import update_many
+
+    calls = []
+
+    def mock_slides_batch_update(requests, presentation_id):
+        calls.append(requests)
+        return {"replies": [{} for _ in requests]}
+
+    monkeypatch.setattr(gslides_api.element, "slides_batch_update", mock_slides_batch_update)
+
+    elements = [
+        PageElement(
+            objectId=f"element_{i}",
+            size=Size(width=100, height=100),
+            transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+            title=f"Title {i}",
+        )
+        for i in range(3)
+    ]
+
+    out = update_many(elements, ["a", "b", "c"], "presentation_id")
+    assert len(calls) == 1
+    assert [r["updatePageElementProperties"]["objectId"] for r in calls[0]] == ["a", "b", "c"]
+    assert [
+        r["updatePageElementProperties"]["pageElementProperties"]["title"] for r in calls[0]
+    ] == ["Title 0", "Title 1", "Title 2"]
+    assert out == {"replies": [{}, {}, {}]}
+
+    # Nothing to update means no API call at all
+    untitled = elements[0].model_copy(update={"title": None})
+    assert update_many([untitled], ["a"], "presentation_id") == {}
+    assert len(calls) == 1
+
+    # Mismatched lists must not silently drop targets
+    with pytest.raises(ValueError):
+        update_many(elements, ["a", "b"], "presentation_id")
+    assert len(calls) == 1
+
+
+def test_text_run_content_can_be_edited_in_place():
+    """Test that editing a text run's content is reflected in the update request."""
+    element = PageElement(
+        objectId="shape_id",
+        size=Size(width=100, height=100),
+        transform=Transform(translateX=0, translateY=0, scaleX=1, scaleY=1),
+        shape=Shape(
+            shapeType=ShapeType.TEXT_BOX,
+            shapeProperties=ShapeProperties(),
+            text=Text(textElements=[TextElement(endIndex=6, textRun=TextRun(content="Hello\n"))]),
+        ),
+    )
+
+    element.shape.text.textElements[0].textRun.content = "Bye\n"
+
+    requests = element.element_to_update_request("shape_id")
+    assert requests[0]["insertText"]["text"] == "Bye\n"
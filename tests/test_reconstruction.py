@@ -180,3 +180,34 @@ def test_deep_comparison(
         assert not differences, f"Found {len(differences)} differences:\n{diff_message}"
     else:
         assert True, "No differences found in the deep comparison"
+
+
+def test_api_json_matches_api_format(
+    presentation_model: Presentation, reconstructed_json: Dict[str, Any]
+):
+    """Test that to_api_json encodes the same structure as to_api_format."""
+    differences = json_diff(reconstructed_json, json.loads(presentation_model.to_api_json()))
+    assert not differences, f"Found {len(differences)} differences: {differences[:5]}"
+
+
+def test_slide_from_id(presentation_model: Presentation):
+    """Test that slide_from_id finds slides by id and follows changes to the slides list."""
+    original = presentation_model.model_copy(deep=True)
+
+    for slide in presentation_model.slides:
+        assert presentation_model.slide_from_id(slide.objectId) is slide
+    assert presentation_model.slide_from_id("no-such-slide") is None
+
+    removed = presentation_model.slides.pop()
+    assert presentation_model.slide_from_id(removed.objectId) is None
+    presentation_model.slides.append(removed)
+    assert presentation_model.slide_from_id(removed.objectId) is removed
+
+    # Replacing a slide in place must not leave the old one reachable
+    replaced = presentation_model.slides[0]
+    presentation_model.slides[0] = presentation_model.slides[1]
+    assert presentation_model.slide_from_id(replaced.objectId) is None
+    presentation_model.slides[0] = replaced
+
+    # Lookups leave no state behind that would affect equality
+    assert presentation_model == original
@@ -1,6 +1,6 @@
 import pytest
 from gslides_api.page import Page
-from gslides_api import SlidePageProperties
+from gslides_api import SlidePageProperties, ElementKind
 
 
 def test_presentation_id_not_in_api_format():
@@ -117,3 +117,85 @@ def test_duplicate_preserves_presentation_id(monkeypatch):
 
     # Check that presentation_id is preserved on the returned slide
     assert result.presentation_id == "test-presentation-id"
+
+
+def test_select_elements_by_kind():
+    """Test that select_elements returns only the elements of the requested kind."""
+    element_json = {
+        "size": {"width": 100, "height": 100},
+        "transform": {"translateX": 0, "translateY": 0, "scaleX": 1, "scaleY": 1},
+    }
+    slide = Page.model_validate(
+        {
+            "objectId": "test-slide-id",
+            "pageElements": [
+                {"objectId": "shape-id", "shape": {"shapeProperties": {}}, **element_json},
+                {"objectId": "image-id", "image": {"contentUrl": "x"}, **element_json},
+            ],
+        }
+    )
+
+    assert [e.objectId for e in slide.select_elements(ElementKind.SHAPE)] == ["shape-id"]
+    assert [e.objectId for e in slide.select_elements(ElementKind.IMAGE)] == ["image-id"]
+    assert slide.select_elements(ElementKind.TABLE) == []
+
+
+def test_write_copy_batches_element_requests(monkeypatch):
+    """Test that write_copy creates and updates all elements in a single batch update."""
+    element_json = {
+        "size": {"width": 100, "height": 100},
+        "transform": {"translateX": 0, "translateY": 0, "scaleX": 1, "scaleY": 1},
+    }
+    slide = Page.model_validate(
+        {
+            "objectId": "test-slide-id",
+            "slideProperties": {"layoutObjectId": "test-layout-id", "isSkipped": False},
+            "pageProperties": {},
+            "pageElements": [
+                {
+                    "objectId": "shape-id",
+                    "shape": {
+                        "shapeProperties": {},
+                        "text": {"textElements": [{"endIndex": 3, "textRun": {"content": "Hi\n"}}]},
+                    },
+                    **element_json,
+                },
+                {
+                    "objectId": "image-id",
+                    "image": {"contentUrl": "x", "imageProperties": {"transparency": 0.5}},
+                    **element_json,
+                },
+            ],
+        }
+    )
+    layout_slide = Page.model_validate(
+        {
+            "objectId": "new-slide-id",
+            "pageElements": [
+                {"objectId": "layout-shape-id", "shape": {"shapeProperties": {}}, **element_json}
+            ],
+        }
+    )
+
+    page_calls = []
+
+    def mock_page_batch_update(requests, presentation_id):
+        page_calls.append(requests)
+        return {}
+
+    import gslides_api.page
+
+    monkeypatch.setattr(Page, "create_blank", lambda self, *args, **kwargs: layout_slide)
+    monkeypatch.setattr(Page, "from_ids", classmethod(lambda cls, p_id, s_id: layout_slide))
+    monkeypatch.setattr(gslides_api.page, "slides_batch_update", mock_page_batch_update)
+    monkeypatch.setattr(gslides_api.page, "new_object_id", lambda: "new-image-id")
+
+    slide.write_copy(presentation_id="test-presentation-id")
+
+    # One call for the page properties, one for the slide properties and all elements
+    assert len(page_calls) == 2
+    final = page_calls[-1]
+    assert "updateSlideProperties" in final[0]
+    assert final[1] == slide.pageElements[1].create_request("new-slide-id", "new-image-id")[0]
+    updated_ids = {list(r.values())[0]["objectId"] for r in final[2:]}
+    assert updated_ids == {"layout-shape-id", "new-image-id"}
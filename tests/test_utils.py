@@ -0,0 +1,30 @@
+import sys
+
+from gslides_api.utils import dict_to_dot_separated_field_list
+
+
+def test_dot_separated_field_list_nested():
+    """Test that nested dicts are flattened to dot-separated leaf paths."""
+    props = {
+        "transparency": 0.5,
+        "outline": {"weight": {"magnitude": 1, "unit": "PT"}, "dashStyle": "SOLID"},
+    }
+
+    assert dict_to_dot_separated_field_list(props) == [
+        "transparency",
+        "outline.weight.magnitude",
+        "outline.weight.unit",
+        "outline.dashStyle",
+    ]
+
+
+def test_dot_separated_field_list_deeper_than_recursion_limit():
+    """Test that flattening does not recurse, so nesting depth is not bounded by the stack."""
+    depth = sys.getrecursionlimit() + 100
+    props = {"leaf": 1}
+    for i in range(depth):
+        props = {f"k{i}": props}
+
+    (field,) = dict_to_dot_separated_field_list(props)
+    assert field.count(".") == depth
+    assert field.endswith(".leaf")